@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Build script for pre-converted Whisper engines.
+Converts the OpenAI Whisper checkpoints to CTranslate2 once, already quantized,
+so video_transcriber.py can load them from engines/<model_size> on every run
+without downloading or converting weights at load time.
+"""
+
+import os
+import sys
+import argparse
+import subprocess
+
+# Where video_transcriber.py looks for engines; kept local so building engines does not
+# import the transcriber and its dependencies. Must match ENGINE_DIR there.
+ENGINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "engines")
+
+# Hugging Face checkpoints for each model size accepted by video_transcriber.py
+HF_MODELS = {
+    "tiny": "openai/whisper-tiny",
+    "base": "openai/whisper-base",
+    "small": "openai/whisper-small",
+    "medium": "openai/whisper-medium",
+    "large": "openai/whisper-large-v3",
+}
+
+
+def build_engine(model_size: str, quantization: str) -> bool:
+    """
+    Convert one Whisper checkpoint into ENGINE_DIR/<model_size>.
+    
+    Args:
+        model_size: Whisper model size ("tiny", "base", "small", "medium", "large")
+        quantization: Weight type stored in the engine, should match the compute type used at run time
+        
+    Returns:
+        True if the engine was built
+    """
+    output_dir = os.path.join(ENGINE_DIR, model_size)
+    cmd = [
+        "ct2-transformers-converter",
+        "--model", HF_MODELS[model_size],
+        "--output_dir", output_dir,
+        "--copy_files", "tokenizer.json", "preprocessor_config.json",
+        "--quantization", quantization,
+        "--force"
+    ]
+    
+    print(f"Building {model_size} engine ({quantization}) in {output_dir}")
+    try:
+        subprocess.run(cmd, check=True)
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"Error building {model_size} engine: {e}")
+        return False
+
+
+def main():
+    """Main function to handle command line arguments and build the engines."""
+    parser = argparse.ArgumentParser(
+        description="Pre-convert Whisper models to CTranslate2 engines for video_transcriber.py"
+    )
+    parser.add_argument(
+        "models",
+        nargs="+",
+        choices=sorted(HF_MODELS),
+        help="Model sizes to build"
+    )
+    parser.add_argument(
+        "-q", "--quantization",
+        choices=["int8", "int8_float16", "float16", "float32"],
+        default="int8_float16",
+        help="Weight type stored in the engine; use the compute type you transcribe with (default: int8_float16)"
+    )
+    
+    args = parser.parse_args()
+    
+    # Check if the converter is available
+    try:
+        subprocess.run(["ct2-transformers-converter", "--help"], capture_output=True, check=True)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        print("Error: ct2-transformers-converter is not installed or not in PATH")
+        print("Please install it: pip install ctranslate2 transformers[torch]")
+        sys.exit(1)
+    
+    failed = [size for size in args.models if not build_engine(size, args.quantization)]
+    if failed:
+        print(f"\nFailed to build: {', '.join(failed)}")
+        sys.exit(1)
+    
+    print(f"\nEngines saved to {ENGINE_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ This script demonstrates the various combinations of language, model, and output
 
 import os
 import sys
+import tempfile
 from pathlib import Path
 
 # Add the current directory to Python path to import video_transcriber
@@ -34,60 +35,64 @@ def demo_all_options():
     print(f"Video folder: {video_folder}")
     print()
     
-    # Demo 1: Basic usage (auto language, base model)
-    print("Demo 1: Basic Usage (Auto Language, Base Model)")
-    print("-" * 50)
-    output_basic = "demo_basic.csv"
-    try:
-        process_video_folder(video_folder, output_basic)
-        print(f"✓ Basic transcription completed: {output_basic}")
-    except Exception as e:
-        print(f"✗ Basic transcription failed: {e}")
-    print()
-    
-    # Demo 2: Force Thai with small model
-    print("Demo 2: Force Thai Language, Small Model")
-    print("-" * 45)
-    output_thai_small = "demo_thai_small.csv"
-    try:
-        process_video_folder(video_folder, output_thai_small, language="th", model_size="small")
-        print(f"✓ Thai transcription with small model completed: {output_thai_small}")
-    except Exception as e:
-        print(f"✗ Thai transcription with small model failed: {e}")
-    print()
-    
-    # Demo 3: Force English with large model
-    print("Demo 3: Force English Language, Large Model")
-    print("-" * 47)
-    output_english_large = "demo_english_large.csv"
-    try:
-        process_video_folder(video_folder, output_english_large, language="en", model_size="large")
-        print(f"✓ English transcription with large model completed: {output_english_large}")
-    except Exception as e:
-        print(f"✗ English transcription with large model failed: {e}")
-    print()
-    
-    # Demo 4: Auto language with tiny model (fastest)
-    print("Demo 4: Auto Language, Tiny Model (Fastest)")
-    print("-" * 45)
-    output_auto_tiny = "demo_auto_tiny.csv"
-    try:
-        process_video_folder(video_folder, output_auto_tiny, model_size="tiny")
-        print(f"✓ Auto language with tiny model completed: {output_auto_tiny}")
-    except Exception as e:
-        print(f"✗ Auto language with tiny model failed: {e}")
-    print()
-    
-    # Demo 5: Auto language with medium model (balanced)
-    print("Demo 5: Auto Language, Medium Model (Balanced)")
-    print("-" * 47)
-    output_auto_medium = "demo_auto_medium.csv"
-    try:
-        process_video_folder(video_folder, output_auto_medium, model_size="medium")
-        print(f"✓ Auto language with medium model completed: {output_auto_medium}")
-    except Exception as e:
-        print(f"✗ Auto language with medium model failed: {e}")
-    print()
+    # Share decoded audio between the demos, so ffmpeg only runs for the first one
+    with tempfile.TemporaryDirectory() as audio_cache:
+        # Demo 1: Basic usage (auto language, base model)
+        print("Demo 1: Basic Usage (Auto Language, Base Model)")
+        print("-" * 50)
+        output_basic = "demo_basic.csv"
+        try:
+            process_video_folder(video_folder, output_basic, audio_cache_dir=audio_cache)
+            print(f"✓ Basic transcription completed: {output_basic}")
+        except Exception as e:
+            print(f"✗ Basic transcription failed: {e}")
+        print()
+        
+        # Demo 2: Force Thai with small model
+        print("Demo 2: Force Thai Language, Small Model")
+        print("-" * 45)
+        output_thai_small = "demo_thai_small.csv"
+        try:
+            process_video_folder(video_folder, output_thai_small, language="th", model_size="small",
+                                 audio_cache_dir=audio_cache)
+            print(f"✓ Thai transcription with small model completed: {output_thai_small}")
+        except Exception as e:
+            print(f"✗ Thai transcription with small model failed: {e}")
+        print()
+        
+        # Demo 3: Force English with large model
+        print("Demo 3: Force English Language, Large Model")
+        print("-" * 47)
+        output_english_large = "demo_english_large.csv"
+        try:
+            process_video_folder(video_folder, output_english_large, language="en", model_size="large",
+                                 audio_cache_dir=audio_cache)
+            print(f"✓ English transcription with large model completed: {output_english_large}")
+        except Exception as e:
+            print(f"✗ English transcription with large model failed: {e}")
+        print()
+        
+        # Demo 4: Auto language with tiny model (fastest)
+        print("Demo 4: Auto Language, Tiny Model (Fastest)")
+        print("-" * 45)
+        output_auto_tiny = "demo_auto_tiny.csv"
+        try:
+            process_video_folder(video_folder, output_auto_tiny, model_size="tiny", audio_cache_dir=audio_cache)
+            print(f"✓ Auto language with tiny model completed: {output_auto_tiny}")
+        except Exception as e:
+            print(f"✗ Auto language with tiny model failed: {e}")
+        print()
+        
+        # Demo 5: Auto language with medium model (balanced)
+        print("Demo 5: Auto Language, Medium Model (Balanced)")
+        print("-" * 47)
+        output_auto_medium = "demo_auto_medium.csv"
+        try:
+            process_video_folder(video_folder, output_auto_medium, model_size="medium", audio_cache_dir=audio_cache)
+            print(f"✓ Auto language with medium model completed: {output_auto_medium}")
+        except Exception as e:
+            print(f"✗ Auto language with medium model failed: {e}")
+        print()
     
     print("=" * 50)
     print("All demos completed!")
@@ -4,9 +4,14 @@ Example script demonstrating how to use the video transcriber programmatically.
 This shows how to integrate the transcriber into your own Python code.
 """
 
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from video_transcriber import process_video_folder
+from video_transcriber import load_model, process_video_folder
+
+# CPU cores given to each worker when batch processing without a GPU
+CPU_CORES_PER_WORKER = 4
 
 def example_basic_usage():
     """Example of basic usage."""
@@ -96,8 +101,20 @@ def example_custom_output():
         print(f"Folder {video_folder} does not exist.")
         print("Please modify the script with a valid path.")
 
+def _init_batch_worker(worker_counter, num_gpus, model_size):
+    """Pin a batch worker to one GPU and load its model before any folder arrives."""
+    with worker_counter.get_lock():
+        worker_rank = worker_counter.value
+        worker_counter.value += 1
+    
+    if num_gpus:
+        os.environ["CUDA_VISIBLE_DEVICES"] = str(worker_rank % num_gpus)
+    
+    # Cached inside the worker, so every folder it processes reuses this model
+    load_model(model_size)
+
 def example_batch_processing():
-    """Example of processing multiple folders."""
+    """Example of processing multiple folders in parallel."""
     print("\nExample 5: Batch Processing Multiple Folders")
     print("-" * 30)
     
@@ -107,18 +124,48 @@ def example_batch_processing():
         "/path/to/folder2",
         "/path/to/folder3"
     ]
+    model_size = "base"
     
+    jobs = []
     for i, folder in enumerate(video_folders, 1):
         if os.path.exists(folder):
-            output_file = f"batch_output_{i}.csv"
+            jobs.append((i, folder, f"batch_output_{i}.csv"))
+        else:
+            print(f"Folder {folder} does not exist, skipping...\n")
+    
+    if not jobs:
+        return
+    
+    # Imported here so the other examples run without PyTorch installed
+    import torch
+    
+    # One worker per GPU, or one per CPU_CORES_PER_WORKER cores without a GPU
+    num_gpus = torch.cuda.device_count()
+    if num_gpus:
+        num_workers = num_gpus
+    else:
+        num_workers = max(1, (os.cpu_count() or 1) // CPU_CORES_PER_WORKER)
+    num_workers = min(num_workers, len(jobs))
+    
+    # Spawn so each worker initializes CUDA after its device has been pinned
+    context = multiprocessing.get_context("spawn")
+    worker_counter = context.Value("i", 0)
+    with ProcessPoolExecutor(
+        max_workers=num_workers,
+        mp_context=context,
+        initializer=_init_batch_worker,
+        initargs=(worker_counter, num_gpus, model_size),
+    ) as executor:
+        futures = {}
+        for i, folder, output_file in jobs:
             print(f"Processing folder {i}: {folder}")
             print(f"Output: {output_file}")
-            
-            # Process each folder
-            process_video_folder(folder, output_file)
+            futures[i] = executor.submit(process_video_folder, folder, output_file, model_size=model_size)
+        
+        for i, future in futures.items():
+            # Wait for each folder in submission order
+            future.result()
             print(f"Completed folder {i}\n")
-        else:
-            print(f"Folder {folder} does not exist, skipping...\n")
 
 def main():
     """Run all examples."""
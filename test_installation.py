@@ -5,7 +5,8 @@ Run this script to check if your environment is ready for video transcription.
 """
 
 import sys
-import subprocess
+import shutil
+import importlib.util
 
 def test_python_version():
     """Test if Python version is compatible."""
@@ -17,42 +18,27 @@ def test_python_version():
 
 def test_ffmpeg():
     """Test if ffmpeg is available."""
-    try:
-        result = subprocess.run(["ffmpeg", "-version"], 
-                              capture_output=True, text=True, check=True)
-        version = result.stdout.split('\n')[0]
-        print("✓ ffmpeg found:", version)
+    path = shutil.which("ffmpeg")
+    if path:
+        print("✓ ffmpeg found:", path)
         return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("✗ ffmpeg not found. Please install ffmpeg.")
-        return False
-
-def test_ffprobe():
-    """Test if ffprobe is available."""
-    try:
-        result = subprocess.run(["ffprobe", "-version"], 
-                              capture_output=True, text=True, check=True)
-        version = result.stdout.split('\n')[0]
-        print("✓ ffprobe found:", version)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("✗ ffprobe not found. Please install ffmpeg (includes ffprobe).")
-        return False
+    print("✗ ffmpeg not found. Please install ffmpeg.")
+    return False
 
 def test_python_packages():
     """Test if required Python packages are installed."""
     required_packages = [
-        ("whisper", "openai-whisper"),
+        ("faster_whisper", "faster-whisper"),
         ("torch", "PyTorch"),
         ("numpy", "NumPy")
     ]
     
     all_installed = True
     for package, display_name in required_packages:
-        try:
-            __import__(package)
+        # find_spec locates the package without importing it (and its CUDA runtime)
+        if importlib.util.find_spec(package) is not None:
             print(f"✓ {display_name} installed")
-        except ImportError:
+        else:
             print(f"✗ {display_name} not installed")
             all_installed = False
     
@@ -66,7 +52,6 @@ def main():
     tests = [
         test_python_version,
         test_ffmpeg,
-        test_ffprobe,
         test_python_packages
     ]
     
@@ -9,107 +9,486 @@ import os
 import sys
 import argparse
 import csv
+import hashlib
+import queue
 import subprocess
 import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
-import whisper
-import torch
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Tuple
 
+import numpy as np
 
-def extract_audio_from_video(video_path: str, output_dir: str) -> str:
+# ctranslate2, faster_whisper and torch are imported where the faster-whisper backend
+# needs them, so the whisper.cpp backend runs without the CTranslate2/PyTorch stack
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+
+# Supported video extensions, lowercase
+VIDEO_EXTENSIONS = (".mov", ".mp4")
+
+# Whisper models expect mono audio sampled at 16kHz
+SAMPLE_RATE = 16000
+
+# Length of the audio windows Whisper decodes, in seconds
+CHUNK_SECONDS = 30
+
+# Number of videos decoded ahead of the one being transcribed
+PREFETCH_DEPTH = 2
+
+# Write buffer for the output CSV; rows are flushed once per video
+CSV_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Quantized GGML weights used by the whisper.cpp backend, downloaded on first use
+# from https://huggingface.co/ggerganov/whisper.cpp (ggml-<name>.bin)
+WHISPER_CPP_MODELS = {
+    "tiny": "tiny-q5_1",
+    "base": "base-q5_1",
+    "small": "small-q5_1",
+    "medium": "medium-q5_0",
+    "large": "large-v3-q5_0",
+}
+
+# Pre-converted CTranslate2 models written by build_engine.py, one directory per model size
+# (build_engine.py defines the same path; keep the two in sync)
+ENGINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "engines")
+
+# Silero VAD settings: silences of at least half a second are cut before decoding
+VAD_PARAMETERS = {"min_silence_duration_ms": 500}
+
+# A batched clip is treated as silence when its no-speech probability exceeds NO_SPEECH_THRESHOLD
+# and its decode is not confident, i.e. the average token log-probability is below
+# LOG_PROB_THRESHOLD (the same rule and defaults faster-whisper applies to each window)
+NO_SPEECH_THRESHOLD = 0.6
+LOG_PROB_THRESHOLD = -1.0
+
+# Minimum confidence before a language detected on one file is reused for the whole folder
+MIN_LANGUAGE_PROBABILITY = 0.5
+
+
+def _audio_cache_path(video_path: str, audio_cache_dir: str) -> str:
+    """Cache file for a video's decoded audio, keyed on its path, modification time and sample rate."""
+    key = f"{os.path.abspath(video_path)}:{os.path.getmtime(video_path)}:{SAMPLE_RATE}"
+    return os.path.join(audio_cache_dir, hashlib.sha1(key.encode()).hexdigest()[:16] + ".pcm")
+
+
+def extract_audio_pcm(video_path: str, audio_cache_dir: str = None) -> np.ndarray:
     """
-    Extract audio from video file using ffmpeg.
+    Decode the audio track of a video file straight into memory using ffmpeg.
     
     Args:
         video_path: Path to the video file
-        output_dir: Directory to save the extracted audio
+        audio_cache_dir: Optional directory for reusing decoded audio across runs;
+            a video is only decoded again after it has been modified
         
     Returns:
-        Path to the extracted audio file
+        Mono 16kHz float32 samples in [-1, 1], or None if extraction failed
     """
-    video_name = Path(video_path).stem
-    audio_path = os.path.join(output_dir, f"{video_name}.wav")
+    cache_path = _audio_cache_path(video_path, audio_cache_dir) if audio_cache_dir else None
+    if cache_path and os.path.exists(cache_path):
+        return np.fromfile(cache_path, np.int16).astype(np.float32) / 32768.0
     
-    # Use ffmpeg to extract audio
+    # Stream raw PCM to stdout instead of writing a temporary WAV file
     cmd = [
-        "ffmpeg", "-i", video_path,
+        "ffmpeg", "-nostdin",  # Never read the terminal from the producer thread
+        "-i", video_path,
+        "-map", "0:a:0",  # Demux only the first audio stream, video packets are never decoded
         "-vn",  # No video
+        "-f", "s16le",  # Raw PCM container
         "-acodec", "pcm_s16le",  # PCM 16-bit
-        "-ar", "16000",  # 16kHz sample rate
-        "-ac", "1",  # Mono
-        "-y",  # Overwrite output file
-        audio_path
+        "-ar", str(SAMPLE_RATE),  # 16kHz sample rate
+        "-ac", "1",  # Mono, downmixing every channel of multichannel sources
+        "-"
     ]
     
     try:
-        subprocess.run(cmd, check=True, capture_output=True)
-        return audio_path
+        # ffmpeg's progress output on stderr is discarded rather than buffered in memory
+        result = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
     except subprocess.CalledProcessError as e:
+        # Run again with stderr captured, only to report why it failed
+        retry = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                               text=True, errors="replace")
+        details = retry.stderr.strip().splitlines()
         print(f"Error extracting audio from {video_path}: {e}")
+        if details:
+            print(f"  ffmpeg: {details[-1]}")
         return None
+    
+    if cache_path:
+        # Write under a unique temporary name so a concurrent reader never sees a partial
+        # file; the cache is only an optimization, so a failed write never loses the audio
+        partial_path = None
+        try:
+            os.makedirs(audio_cache_dir, exist_ok=True)
+            fd, partial_path = tempfile.mkstemp(suffix=".tmp", dir=audio_cache_dir)
+            with os.fdopen(fd, "wb") as f:
+                f.write(result.stdout)
+            os.replace(partial_path, cache_path)
+        except OSError as e:
+            print(f"Could not cache audio for {video_path}: {e}")
+            if partial_path:
+                try:
+                    os.remove(partial_path)
+                except OSError:
+                    pass
+    
+    return np.frombuffer(result.stdout, np.int16).astype(np.float32) / 32768.0
 
 
-def get_video_duration(video_path: str) -> float:
+def resolve_compute_type(device: str, compute_type: str = "auto") -> str:
     """
-    Get video duration in seconds using ffprobe.
+    Pick the CTranslate2 compute type for the given device.
     
     Args:
-        video_path: Path to the video file
+        device: "cuda" or "cpu"
+        compute_type: Requested compute type, "auto" for the lowest precision the device
+            runs natively (int8_float16, then float16 on GPU; int8 on CPU)
         
     Returns:
-        Duration in seconds
+        Compute type to pass to faster-whisper
     """
-    cmd = [
-        "ffprobe", "-v", "quiet",
-        "-show_entries", "format=duration",
-        "-of", "csv=p=0",
-        video_path
-    ]
+    if compute_type != "auto":
+        return compute_type
     
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        duration = float(result.stdout.strip())
-        return duration
-    except (subprocess.CalledProcessError, ValueError) as e:
-        print(f"Error getting duration for {video_path}: {e}")
-        return 0.0
+    import ctranslate2
+    
+    if device == "cuda":
+        preferred = ("int8_float16", "float16", "float32")
+    else:
+        preferred = ("int8", "float32")
+    supported = ctranslate2.get_supported_compute_types(device)
+    for candidate in preferred:
+        if candidate in supported:
+            return candidate
+    return "default"
+
+
+class TorchFeatureExtractor:
+    """
+    Log-mel feature extractor that runs the STFT with torch on the GPU.
+    
+    Drop-in replacement for faster-whisper's NumPy FeatureExtractor, which computes
+    the STFT of every 30-second window on the CPU. The features are returned
+    as a NumPy array because that is what faster-whisper hands to CTranslate2.
+    The audio is transformed one 30-second window at a time, so GPU memory use
+    stays at a few MB however long the file is.
+    """
+    
+    def __init__(self, base, device: str):
+        import torch
+        
+        # Reuse the model's settings (mel filters, FFT size, hop length, chunk length)
+        self.__dict__.update(base.__dict__)
+        self.torch_device = device
+        self.torch_mel_filters = torch.from_numpy(np.asarray(base.mel_filters, dtype=np.float32)).to(device)
+        self.torch_window = torch.hann_window(base.n_fft, device=device)
+    
+    def __call__(self, waveform: np.ndarray, padding: int = 160, chunk_length: int = None) -> np.ndarray:
+        import torch
+        
+        if chunk_length is not None:
+            self.n_samples = chunk_length * self.sampling_rate
+            self.nb_max_frames = self.n_samples // self.hop_length
+        
+        waveform = np.asarray(waveform, dtype=np.float32)
+        if padding:
+            waveform = np.pad(waveform, (0, padding))
+        # Same framing as the NumPy extractor: reflect-pad by half a window (center=True)
+        # and drop the last frame
+        n_frames = waveform.shape[0] // self.hop_length
+        waveform = np.pad(waveform, self.n_fft // 2, mode="reflect")
+        
+        log_spec = np.empty((self.mel_filters.shape[0], n_frames), dtype=np.float32)
+        with torch.inference_mode():
+            for start in range(0, n_frames, self.nb_max_frames):
+                stop = min(start + self.nb_max_frames, n_frames)
+                window_samples = waveform[start * self.hop_length:(stop - 1) * self.hop_length + self.n_fft]
+                audio = torch.from_numpy(window_samples).to(self.torch_device)
+                stft = torch.stft(audio, self.n_fft, self.hop_length, window=self.torch_window,
+                                  center=False, return_complex=True)
+                mel_spec = self.torch_mel_filters @ (stft.abs() ** 2)
+                log_spec[:, start:stop] = torch.clamp(mel_spec, min=1e-10).log10().cpu().numpy()
+        
+        log_spec = np.maximum(log_spec, log_spec.max() - 8.0)
+        return (log_spec + 4.0) / 4.0
 
 
-def transcribe_audio(audio_path: str, model, language: str = None) -> List[Tuple[float, float, str]]:
+def _features_match(extractor, reference) -> bool:
+    """Check an extractor against faster-whisper's NumPy one on 35 seconds of noise."""
+    rng = np.random.default_rng(0)
+    # Long enough to span more than one 30-second window
+    waveform = rng.uniform(-0.5, 0.5, extractor.n_samples + 5 * extractor.sampling_rate).astype(np.float32)
+    expected = reference(waveform)
+    actual = extractor(waveform)
+    return actual.shape == expected.shape and np.allclose(actual, expected, atol=1e-3)
+
+
+class WhisperCppModel:
     """
-    Transcribe audio using WhisperAI.
+    whisper.cpp backend for CPU-only hosts, through the pywhispercpp bindings.
+    
+    Runs quantized GGML weights with SIMD kernels (AVX2/AVX-512/NEON), which is
+    faster and much lighter on memory than the CTranslate2 backend on CPU.
+    """
+    
+    def __init__(self, model_size: str):
+        try:
+            from pywhispercpp.model import Model
+        except ImportError:
+            print("Error: the whisper.cpp backend requires pywhispercpp")
+            print("Please install it: pip install pywhispercpp")
+            sys.exit(1)
+        self.model = Model(WHISPER_CPP_MODELS[model_size], n_threads=os.cpu_count())
+    
+    def transcribe(self, audio: np.ndarray, language: str = None):
+        """Yield (start_time, end_time, text) tuples; whisper.cpp reports times in centiseconds."""
+        for segment in self.model.transcribe(audio, language=language or "auto"):
+            yield segment.t0 / 100.0, segment.t1 / 100.0, segment.text
+
+
+@lru_cache(maxsize=4)
+def _get_cpp_model(model_size: str) -> WhisperCppModel:
+    """Load a whisper.cpp model, reusing the in-memory copy for repeated sizes."""
+    return WhisperCppModel(model_size)
+
+
+@lru_cache(maxsize=4)
+def _get_model(model_size_or_path: str, device: str, compute_type: str) -> "WhisperModel":
+    """Load a faster-whisper model, reusing the in-memory copy for repeated keys."""
+    from faster_whisper import WhisperModel
+    
+    model = WhisperModel(model_size_or_path, device=device, compute_type=compute_type)
+    if device == "cuda":
+        gpu_extractor = TorchFeatureExtractor(model.feature_extractor, device)
+        if _features_match(gpu_extractor, model.feature_extractor):
+            model.feature_extractor = gpu_extractor
+        else:
+            print("  GPU feature extraction does not match faster-whisper's, using the CPU extractor")
+    return model
+
+
+def load_model(model_size: str = "base", compute_type: str = "auto", backend: str = "faster-whisper"):
+    """
+    Load a Whisper model on the best available device.
+    
+    If build_engine.py has written engines/<model_size>, that pre-converted
+    model is loaded instead of the hub weights.
+    
+    Models are cached per (model_size, device, compute_type), so calling
+    process_video_folder repeatedly with the same settings only loads the
+    model once. The cache holds four models; callers that loop over several
+    sizes should visit them in a fixed order to keep hitting it.
     
     Args:
-        audio_path: Path to the audio file
-        model: Loaded Whisper model
+        model_size: Whisper model size ("tiny", "base", "small", "medium", "large")
+        compute_type: CTranslate2 compute type, see resolve_compute_type
+        backend: "faster-whisper" (CTranslate2, CPU or GPU) or "cpp" (whisper.cpp, CPU only)
+        
+    Returns:
+        Loaded faster-whisper WhisperModel, or a WhisperCppModel for the cpp backend
+    """
+    if backend == "cpp":
+        print(f"Loading whisper.cpp model: {WHISPER_CPP_MODELS[model_size]} (cpu)")
+        return _get_cpp_model(model_size)
+    
+    import torch
+    
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    compute_type = resolve_compute_type(device, compute_type)
+    print(f"Loading Whisper model: {model_size} ({device}, {compute_type})")
+    
+    # Prefer a locally built engine over downloading and converting hub weights
+    engine_path = os.path.join(ENGINE_DIR, model_size)
+    if os.path.isdir(engine_path):
+        print(f"  Using prebuilt engine: {engine_path}")
+        return _get_model(engine_path, device, compute_type)
+    return _get_model(model_size, device, compute_type)
+
+
+def transcribe_audio(audio: np.ndarray, model, language: str = None,
+                     batch_size: int = 1) -> Iterator[Tuple[float, float, str]]:
+    """
+    Transcribe audio using faster-whisper (CTranslate2) or whisper.cpp.
+    
+    Args:
+        audio: Mono 16kHz float32 samples, as returned by extract_audio_pcm
+        model: Model returned by load_model
         language: Force language detection ("th" for Thai, "en" for English, None for auto)
+        batch_size: Number of 30-second windows of long audio decoded in parallel
+            (1 decodes the file sequentially)
+        
+    Yields:
+        Tuples of (start_time, end_time, text), as soon as each segment is decoded
+    """
+    try:
+        if isinstance(model, WhisperCppModel):
+            # whisper.cpp decodes the whole file itself; the options below don't apply
+            segments_iter = model.transcribe(audio, language)
+        else:
+            # Transcribe with timestamps and optional language forcing. The VAD filter drops
+            # silence before decoding; segment times still refer to the original audio.
+            transcribe_options = {
+                "word_timestamps": True,
+                "vad_filter": True,
+                "vad_parameters": VAD_PARAMETERS,
+                "beam_size": 5,
+            }
+            if language:
+                transcribe_options["language"] = language
+            
+            if batch_size > 1 and audio.shape[0] > CHUNK_SECONDS * SAMPLE_RATE:
+                # Long audio: cut it at VAD silences into windows of up to 30 seconds, run them
+                # through the encoder as one batch and decode them independently (no conditioning
+                # on the previous window). Short clips fit in one window and gain nothing from it.
+                from faster_whisper import BatchedInferencePipeline
+                
+                model = BatchedInferencePipeline(model=model)
+                transcribe_options["batch_size"] = batch_size
+            
+            # Segments are produced lazily; decoding happens while iterating
+            fw_segments, _info = model.transcribe(audio, **transcribe_options)
+            segments_iter = ((segment.start, segment.end, segment.text) for segment in fw_segments)
+        
+        for start_time, end_time, text in segments_iter:
+            text = text.strip()
+            
+            if text:  # Only yield non-empty segments
+                yield start_time, end_time, text
+    except Exception as e:
+        print(f"Error transcribing audio: {e}")
+
+
+def transcribe_clips(clips: List[np.ndarray], model: "WhisperModel",
+                     languages: List[str]) -> List[List[Tuple[float, float, str]]]:
+    """
+    Transcribe several short clips (up to 30 seconds each) in one encoder/decoder pass.
+    
+    The clips are padded to one 30-second window each and stacked along the
+    batch dimension, so a folder of short videos is decoded a batch at a time
+    instead of one file at a time. Unlike transcribe_audio there is no VAD
+    filter, no word timestamps and no temperature fallback, and each clip
+    becomes a single segment starting at 0.
+    
+    Args:
+        clips: Mono 16kHz float32 samples, one array per video
+        model: Loaded faster-whisper WhisperModel
+        languages: Language per clip, None to detect it from that clip
         
     Returns:
-        List of tuples: (start_time, end_time, text)
+        List of (start_time, end_time, text) segments for each clip, in order
     """
+    from faster_whisper.audio import pad_or_trim
+    from faster_whisper.tokenizer import Tokenizer
+    
     try:
-        # Transcribe with timestamps and optional language forcing
-        transcribe_options = {"word_timestamps": True}
-        if language:
-            transcribe_options["language"] = language
-            print(f"  Forcing transcription in {language.upper()}")
+        extractor = model.feature_extractor
+        features = np.stack([pad_or_trim(extractor(clip), extractor.nb_max_frames) for clip in clips])
+        encoder_output = model.encode(features)
         
-        result = model.transcribe(audio_path, **transcribe_options)
+        if any(language is None for language in languages):
+            # Each result lists (token, probability) pairs, most likely first, e.g. ("<|th|>", 0.9)
+            detections = model.model.detect_language(encoder_output)
+            languages = [language or detection[0][0][2:-2]
+                         for language, detection in zip(languages, detections)]
         
-        segments = []
-        for segment in result["segments"]:
-            start_time = segment["start"]
-            end_time = segment["end"]
-            text = segment["text"].strip()
-            
-            if text:  # Only add non-empty segments
-                segments.append((start_time, end_time, text))
+        tokenizers = [
+            Tokenizer(model.hf_tokenizer, model.model.is_multilingual, task="transcribe", language=language)
+            for language in languages
+        ]
+        prompts = [model.get_prompt(tokenizer, [], without_timestamps=True) for tokenizer in tokenizers]
+        results = model.model.generate(
+            encoder_output, prompts,
+            beam_size=5, max_length=model.max_length,
+            return_scores=True, return_no_speech_prob=True, suppress_blank=True, suppress_tokens=[-1],
+        )
         
+        segments = []
+        for clip, tokenizer, result in zip(clips, tokenizers, results):
+            tokens = result.sequences_ids[0]
+            # The score is the cumulative log-probability divided by the length (length penalty 1)
+            avg_logprob = result.scores[0] * len(tokens) / (len(tokens) + 1)
+            silent = result.no_speech_prob > NO_SPEECH_THRESHOLD and avg_logprob < LOG_PROB_THRESHOLD
+            text = tokenizer.decode(tokens).strip()
+            if text and not silent:
+                segments.append([(0.0, clip.shape[0] / SAMPLE_RATE, text)])
+            else:
+                segments.append([])
         return segments
     except Exception as e:
-        print(f"Error transcribing {audio_path}: {e}")
-        return []
+        print(f"Error transcribing clip batch: {e}, transcribing one at a time")
+        return [list(transcribe_audio(clip, model, language)) for clip, language in zip(clips, languages)]
+
+
+def write_segments(writer, video_name: str, segments: Iterable[Tuple[float, float, str]]) -> int:
+    """
+    Stream transcribed segments into the CSV writer.
+    
+    The timestamp column is the segment start time in minutes, rounded to the
+    nearest 30 seconds.
+    
+    Args:
+        writer: csv.writer for the output file
+        video_name: Value for the "File Name" column
+        segments: (start_time, end_time, text) tuples, e.g. from transcribe_audio
+        
+    Returns:
+        Number of rows written
+    """
+    count = 0
+    
+    def rows():
+        nonlocal count
+        for start_time, _end_time, text in segments:
+            count += 1
+            yield video_name, f"{round(seconds_to_minutes(start_time) * 2) / 2:.1f}", text
+    
+    writer.writerows(rows())
+    return count
+
+
+def _produce_audio(video_files: List[str], audio_queue: queue.Queue, stop_event: threading.Event,
+                   audio_cache_dir: str = None):
+    """
+    Decode videos ahead of transcription and feed them to the consumer.
+    
+    Puts (video_path, audio) tuples on audio_queue in folder order,
+    followed by None once every video has been handed over. If decoding
+    raises, the exception is put on the queue instead and nothing follows it.
+    Returns early once stop_event is set by the consumer.
+    """
+    def hand_over(item) -> bool:
+        # Time out regularly so a consumer that stopped reading can't block us forever
+        while not stop_event.is_set():
+            try:
+                audio_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    try:
+        with ThreadPoolExecutor(max_workers=PREFETCH_DEPTH) as executor:
+            pending = deque()
+            for video_path in video_files:
+                if stop_event.is_set():
+                    return
+                pending.append((video_path, executor.submit(extract_audio_pcm, video_path, audio_cache_dir)))
+                # Keep at most PREFETCH_DEPTH decodes in flight
+                if len(pending) >= PREFETCH_DEPTH:
+                    path, future = pending.popleft()
+                    if not hand_over((path, future.result())):
+                        return
+            while pending:
+                path, future = pending.popleft()
+                if not hand_over((path, future.result())):
+                    return
+    except BaseException as e:
+        hand_over(e)
+        return
+    hand_over(None)
 
 
 def seconds_to_minutes(seconds: float) -> float:
@@ -117,7 +496,10 @@ def seconds_to_minutes(seconds: float) -> float:
     return seconds / 60.0
 
 
-def process_video_folder(folder_path: str, output_csv: str, language: str = None, model_size: str = "base"):
+def process_video_folder(folder_path: str, output_csv: str, language: str = None, model_size: str = "base",
+                         compute_type: str = "auto", batch_size: int = 8, detect_once: bool = True,
+                         backend: str = "faster-whisper", audio_cache_dir: str = None,
+                         batch_clips: bool = False):
     """
     Process all video files in the specified folder.
     
@@ -126,20 +508,30 @@ def process_video_folder(folder_path: str, output_csv: str, language: str = None
         output_csv: Path to output CSV file
         language: Force language detection ("th" for Thai, "en" for English, None for auto)
         model_size: Whisper model size ("tiny", "base", "small", "medium", "large")
+        compute_type: CTranslate2 compute type ("auto", "int8", "int8_float16", "float16", "float32")
+        batch_size: Number of 30-second windows of a long video, or of short videos across
+            files with batch_clips, decoded in parallel (1 decodes sequentially)
+        detect_once: With automatic language detection, detect the language on the first
+            file with clear speech and reuse it for the rest of the folder instead of detecting
+            per file (faster-whisper backend only; whisper.cpp detects per file)
+        backend: "faster-whisper" or "cpp" for whisper.cpp on CPU-only hosts
+        audio_cache_dir: Directory for caching decoded audio, so repeated runs over the
+            same folder skip ffmpeg for videos that have not changed
+        batch_clips: Decode videos of up to 30 seconds together across files through
+            transcribe_clips (faster-whisper backend only). Faster on folders of short clips,
+            but skips the VAD filter and writes one row per video stamped 0.0
     """
     # Check if folder exists
     if not os.path.isdir(folder_path):
         print(f"Error: {folder_path} is not a valid directory")
         sys.exit(1)
     
-    # Supported video extensions
-    video_extensions = {'.mov', '.mp4', '.MOV', '.MP4'}
-    
-    # Find all video files
-    video_files = []
-    for file in os.listdir(folder_path):
-        if Path(file).suffix in video_extensions:
-            video_files.append(os.path.join(folder_path, file))
+    # Find all video files (extensions are matched case-insensitively)
+    with os.scandir(folder_path) as entries:
+        video_files = [
+            entry.path for entry in entries
+            if entry.is_file() and entry.name.lower().endswith(VIDEO_EXTENSIONS)
+        ]
     
     if not video_files:
         print(f"No video files found in {folder_path}")
@@ -147,53 +539,115 @@ def process_video_folder(folder_path: str, output_csv: str, language: str = None
     
     print(f"Found {len(video_files)} video files to process")
     
-    # Load Whisper model (will download if not present)
-    print(f"Loading Whisper model: {model_size}")
-    model = whisper.load_model(model_size)
+    # Load Whisper model (will download if not present, reused across calls)
+    model = load_model(model_size, compute_type, backend)
+    
+    # ffmpeg runs on a producer thread so the next videos are decoded
+    # while the current one is being transcribed
+    audio_queue = queue.Queue(maxsize=PREFETCH_DEPTH)
+    stop_event = threading.Event()
+    producer = threading.Thread(target=_produce_audio,
+                                args=(video_files, audio_queue, stop_event, audio_cache_dir),
+                                daemon=True)
+    producer.start()
+    
+    # With batch_clips, videos of up to 30 seconds are batched across files through transcribe_clips
+    batch_clips = batch_clips and batch_size > 1 and not isinstance(model, WhisperCppModel)
+    pending_clips = []
+    
+    def report_segments(video_name, segment_count, csvfile):
+        if segment_count:
+            # One flush per file keeps `tail -f` useful without per-row writes
+            csvfile.flush()
+            print(f"  Transcribed {segment_count} segments ({video_name})")
+        else:
+            print(f"  No transcription generated for {video_name}")
     
-    # Create temporary directory for audio files
-    with tempfile.TemporaryDirectory() as temp_dir:
+    def flush_clips(writer, csvfile):
+        if not pending_clips:
+            return
+        names, clips, languages = zip(*pending_clips)
+        pending_clips.clear()
+        for video_name, segments in zip(names, transcribe_clips(list(clips), model, list(languages))):
+            report_segments(video_name, write_segments(writer, video_name, segments), csvfile)
+    
+    # Language detected on an earlier file in auto mode, and whether detection is still to run
+    detected_language = None
+    detect_pending = language is None and detect_once and not isinstance(model, WhisperCppModel)
+    
+    try:
         # Prepare CSV output
-        with open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
+        with open(output_csv, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(['File Name', 'Time (mins)', 'Transcribed Text'])
             
-            # Process each video file
-            for i, video_path in enumerate(video_files, 1):
+            # Process each video file as its audio becomes available
+            for i, item in enumerate(iter(audio_queue.get, None), 1):
+                # Decoding failures on the producer thread are re-raised here
+                if isinstance(item, BaseException):
+                    raise item
+                video_path, audio = item
                 video_name = Path(video_path).name
                 print(f"Processing {i}/{len(video_files)}: {video_name}")
                 
-                # Get video duration
-                duration = get_video_duration(video_path)
-                if duration == 0:
-                    print(f"Skipping {video_name} - could not determine duration")
-                    continue
-                
-                # Extract audio
-                audio_path = extract_audio_from_video(video_path, temp_dir)
-                if not audio_path:
+                if audio is None:
                     print(f"Skipping {video_name} - could not extract audio")
                     continue
                 
-                # Transcribe audio
-                segments = transcribe_audio(audio_path, model, language)
+                # The decoded audio gives the duration for free, no ffprobe needed
+                duration = audio.shape[0] / SAMPLE_RATE
+                if duration == 0:
+                    print(f"Skipping {video_name} - no audio samples")
+                    continue
                 
-                if segments:
-                    # Write segments to CSV
-                    for start_time, end_time, text in segments:
-                        # Use start time for the timestamp, rounded to nearest 30 seconds
-                        time_mins = seconds_to_minutes(start_time)
-                        # Round to nearest 30 seconds (0.5 minutes)
-                        rounded_mins = round(time_mins * 2) / 2
-                        writer.writerow([video_name, f"{rounded_mins:.1f}", text])
+                if language:
+                    print(f"  Forcing transcription in {language.upper()}")
+                elif detect_pending:
+                    # Detect the language once and reuse it, skipping a detection pass per file
+                    from faster_whisper.vad import VadOptions
                     
-                    print(f"  Transcribed {len(segments)} segments")
-                else:
-                    print(f"  No transcription generated for {video_name}")
+                    try:
+                        detected, probability, _ = model.detect_language(
+                            audio, vad_filter=True, vad_parameters=VadOptions(**VAD_PARAMETERS)
+                        )
+                    except Exception as e:
+                        print(f"  Error detecting language: {e}, detecting per file instead")
+                        detect_pending = False
+                    else:
+                        if probability >= MIN_LANGUAGE_PROBABILITY:
+                            detected_language = detected
+                            detect_pending = False
+                            print(f"  Detected language {detected.upper()} ({probability:.0%}), "
+                                  f"using it for the remaining files")
+                        else:
+                            # Likely little or no speech; try again on the next file
+                            print(f"  Language unclear ({detected.upper()}, {probability:.0%}), "
+                                  f"detecting again on the next file")
                 
-                # Clean up audio file
-                if os.path.exists(audio_path):
-                    os.remove(audio_path)
+                if batch_clips and duration <= CHUNK_SECONDS:
+                    # Short clip: queue it and decode it together with the next ones
+                    pending_clips.append((video_name, audio, language or detected_language))
+                    if len(pending_clips) >= batch_size:
+                        flush_clips(writer, csvfile)
+                    continue
+                
+                # Keep the CSV in folder order: clips queued before this video go first
+                flush_clips(writer, csvfile)
+                
+                # Transcribe audio, writing each segment to the CSV as soon as it is decoded
+                segments = transcribe_audio(audio, model, language or detected_language, batch_size)
+                report_segments(video_name, write_segments(writer, video_name, segments), csvfile)
+            
+            flush_clips(writer, csvfile)
+            
+            # Sync to disk once, at the end of the run
+            csvfile.flush()
+            os.fsync(csvfile.fileno())
+    finally:
+        # Stop the producer even if transcription failed, so it doesn't stay
+        # blocked on the queue holding decoded audio
+        stop_event.set()
+        producer.join()
     
     print(f"\nTranscription complete! Results saved to {output_csv}")
 
@@ -224,6 +678,37 @@ def main():
         default="base",
         help="Whisper model size: 'tiny' (fastest), 'base', 'small', 'medium', 'large' (most accurate) (default: base)"
     )
+    parser.add_argument(
+        "-c", "--compute-type",
+        choices=["auto", "int8", "int8_float16", "float16", "float32"],
+        default="auto",
+        help="CTranslate2 compute type: 'auto' uses int8_float16 on GPU and int8 on CPU (default: auto)"
+    )
+    parser.add_argument(
+        "-b", "--batch-size",
+        type=int,
+        default=8,
+        help="Number of 30-second windows of long videos, or of short videos across files with "
+             "--batch-clips, decoded in parallel, 1 to decode sequentially (default: 8)"
+    )
+    parser.add_argument(
+        "--batch-clips",
+        action="store_true",
+        help="Decode videos of up to 30 seconds together across files; faster on folders of short "
+             "clips, but without the VAD filter and with one row per video"
+    )
+    parser.add_argument(
+        "--detect-per-file",
+        action="store_true",
+        help="With '-l auto', detect the language of every file instead of once per folder"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["faster-whisper", "cpp"],
+        default="faster-whisper",
+        help="Inference backend: 'faster-whisper' (CTranslate2, CPU/GPU) or 'cpp' "
+             "(whisper.cpp with quantized weights, CPU only; needs pywhispercpp) (default: faster-whisper)"
+    )
     
     args = parser.parse_args()
     
@@ -237,22 +722,16 @@ def main():
     
     # Check if ffmpeg is available
     try:
-        subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True)
+        subprocess.run(["ffmpeg", "-version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
     except (subprocess.CalledProcessError, FileNotFoundError):
         print("Error: ffmpeg is not installed or not in PATH")
         print("Please install ffmpeg: https://ffmpeg.org/download.html")
         sys.exit(1)
     
-    # Check if ffprobe is available
-    try:
-        subprocess.run(["ffprobe", "-version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("Error: ffprobe is not installed or not in PATH")
-        print("Please install ffmpeg (includes ffprobe): https://ffmpeg.org/download.html")
-        sys.exit(1)
-    
     # Process the video folder
-    process_video_folder(args.folder, args.output, language_code, args.model)
+    process_video_folder(args.folder, args.output, language_code, args.model, args.compute_type,
+                         args.batch_size, detect_once=not args.detect_per_file, backend=args.backend,
+                         batch_clips=args.batch_clips)
 
 
 if __name__ == "__main__":